@@ -1,17 +1,41 @@
 """Configuration management for PowerPoint Analyzer MCP."""
 
 import os
+import sys
 import logging
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+import functools
+from typing import Dict, Any, Optional, Tuple, Callable
+from dataclasses import dataclass, field, fields, replace
 
 
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.lower() == 'true'
+
+
+_VALID_LOG_LEVELS = frozenset(('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'))
+
+# Environment variable overrides: field name -> (variable name, parser)
+_ENV_SETTINGS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    'log_level': ('POWERPOINT_MCP_LOG_LEVEL', str),
+    'max_file_size_mb': ('POWERPOINT_MCP_MAX_FILE_SIZE', int),
+    'processing_timeout_seconds': ('POWERPOINT_MCP_TIMEOUT', int),
+    'cache_enabled': ('POWERPOINT_MCP_CACHE_ENABLED', _parse_bool),
+    'cache_ttl_seconds': ('POWERPOINT_MCP_CACHE_TTL', int),
+    'debug_mode': ('POWERPOINT_MCP_DEBUG', _parse_bool),
+}
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class ServerConfig:
     """Server configuration settings."""
     
     # Logging configuration - default to WARNING for MCP to reduce stderr noise
-    log_level: str = field(default_factory=lambda: os.getenv('POWERPOINT_MCP_LOG_LEVEL', 'WARNING'))
+    log_level: str = field(default='WARNING')
     log_format: str = field(default='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     
     # Server configuration
@@ -19,36 +43,44 @@ class ServerConfig:
     server_version: str = field(default='0.1.0')
     
     # File processing limits
-    max_file_size_mb: int = field(default_factory=lambda: int(os.getenv('POWERPOINT_MCP_MAX_FILE_SIZE', '100')))
-    processing_timeout_seconds: int = field(default_factory=lambda: int(os.getenv('POWERPOINT_MCP_TIMEOUT', '300')))
+    max_file_size_mb: int = field(default=100)
+    processing_timeout_seconds: int = field(default=300)
     
     # Cache configuration
-    cache_enabled: bool = field(default_factory=lambda: os.getenv('POWERPOINT_MCP_CACHE_ENABLED', 'true').lower() == 'true')
-    cache_ttl_seconds: int = field(default_factory=lambda: int(os.getenv('POWERPOINT_MCP_CACHE_TTL', '3600')))
+    cache_enabled: bool = field(default=True)
+    cache_ttl_seconds: int = field(default=3600)
     
     # Debug configuration
-    debug_mode: bool = field(default_factory=lambda: os.getenv('POWERPOINT_MCP_DEBUG', 'false').lower() == 'true')
+    debug_mode: bool = field(default=False)
+    
+    # Derived values (computed once at construction)
+    max_file_size_bytes: int = field(init=False, repr=False)
     
     def __post_init__(self):
-        """Validate configuration after initialization."""
-        self._validate_config()
+        """Compute derived configuration values."""
+        object.__setattr__(self, 'max_file_size_bytes', self.max_file_size_mb * 1024 * 1024)
     
-    def _validate_config(self):
-        """Validate configuration values."""
+    @staticmethod
+    def _validate_config(values: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of configuration values with invalid entries replaced by defaults."""
+        validated = dict(values)
+        
         # Validate log level
-        valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if self.log_level.upper() not in valid_log_levels:
-            self.log_level = 'INFO'
+        log_level = validated.get('log_level')
+        if log_level is not None and log_level.upper() not in _VALID_LOG_LEVELS:
+            validated['log_level'] = 'INFO'
         
         # Validate numeric values
-        if self.max_file_size_mb <= 0:
-            self.max_file_size_mb = 100
+        if validated.get('max_file_size_mb', 1) <= 0:
+            validated['max_file_size_mb'] = 100
+        
+        if validated.get('processing_timeout_seconds', 1) <= 0:
+            validated['processing_timeout_seconds'] = 300
         
-        if self.processing_timeout_seconds <= 0:
-            self.processing_timeout_seconds = 300
+        if validated.get('cache_ttl_seconds', 1) <= 0:
+            validated['cache_ttl_seconds'] = 3600
         
-        if self.cache_ttl_seconds <= 0:
-            self.cache_ttl_seconds = 3600
+        return validated
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
@@ -67,11 +99,17 @@ class ServerConfig:
     @classmethod
     def from_env(cls) -> 'ServerConfig':
         """Create configuration from environment variables."""
-        return cls()
-    
-    def get_max_file_size_bytes(self) -> int:
-        """Get maximum file size in bytes."""
-        return self.max_file_size_mb * 1024 * 1024
+        environ = os.environ
+        values = {}
+        for name, (env_var, parse) in _ENV_SETTINGS.items():
+            raw_value = environ.get(env_var)
+            if raw_value is not None:
+                values[name] = parse(raw_value)
+        return cls(**cls._validate_config(values))
+
+
+# Configuration keys that can be updated; derived values are computed, not set
+_UPDATABLE_CONFIG_KEYS = frozenset(f.name for f in fields(ServerConfig) if f.init)
 
 
 class ConfigManager:
@@ -88,15 +126,19 @@ class ConfigManager:
     
     def update_config(self, **kwargs) -> None:
         """Update configuration values."""
+        updates = {}
         for key, value in kwargs.items():
-            if hasattr(self.config, key):
-                setattr(self.config, key, value)
+            if key in _UPDATABLE_CONFIG_KEYS:
+                updates[key] = value
                 self.logger.debug(f"Configuration updated: {key} = {value}")
+            elif hasattr(self.config, key):
+                self.logger.warning(f"Configuration key {key} is derived and cannot be updated")
             else:
                 self.logger.warning(f"Unknown configuration key: {key}")
         
-        # Re-validate after updates
-        self.config._validate_config()
+        # ServerConfig is immutable, so validate the updates and swap in a new instance
+        self.config = replace(self.config, **ServerConfig._validate_config(updates))
+        get_config.cache_clear()
     
     def log_configuration(self) -> None:
         """Log current configuration (excluding sensitive data)."""
@@ -106,18 +148,13 @@ class ConfigManager:
             self.logger.info(f"  {key}: {value}")
 
 
-# Global configuration instance
-_config_manager: Optional[ConfigManager] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_config_manager() -> ConfigManager:
     """Get the global configuration manager instance."""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager
+    return ConfigManager()
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> ServerConfig:
-    """Get the current server configuration."""
+    """Get the current server configuration (cached until the next update_config)."""
     return get_config_manager().get_config()
\ No newline at end of file
@@ -5,11 +5,16 @@ This module provides attribute filtering functionality to selectively
 extract only requested attributes from PowerPoint content.
 """
 
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, FrozenSet, Tuple, Callable
+import functools
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing missing keys from keys whose value is None
+_MISSING = object()
+
 
 class AttributeProcessor:
     """
@@ -20,12 +25,47 @@ class AttributeProcessor:
     """
     
     # Valid attribute types that can be requested
-    VALID_ATTRIBUTES = {
+    VALID_ATTRIBUTES = frozenset({
         'title', 'subtitle', 'text', 'tables', 'images', 'layout', 
         'size', 'sections', 'notes', 'object_counts', 'placeholders',
         'text_elements', 'metadata', 'slide_count', 'slide_size'
+    })
+    _SORTED_VALID_ATTRIBUTES = tuple(sorted(VALID_ATTRIBUTES))
+    
+    # Slide data keys behind the composite attributes
+    _TEXT_KEYS = ('text_elements', 'content_plain', 'content_formatted')
+    _LAYOUT_KEYS = ('layout_name', 'layout_type', 'placeholders')
+    _SIZE_KEYS = ('slide_size', 'position', 'size')
+    
+    # Slide data keys copied for each requested attribute, in output order
+    _ATTRIBUTE_SOURCES = {
+        'title': ('title',),
+        'subtitle': ('subtitle',),
+        'text': _TEXT_KEYS,
+        'text_elements': ('text_elements',),
+        'tables': ('tables',),
+        'layout': _LAYOUT_KEYS,
+        'placeholders': ('placeholders',),
+        'size': _SIZE_KEYS,
+        'notes': ('notes',),
+        'object_counts': ('object_counts',)
     }
     
+    # Object types tracked in object counts
+    _OBJECT_COUNT_KEYS = (
+        'shapes', 'text_boxes', 'images', 'tables',
+        'charts', 'media', 'connectors', 'groups'
+    )
+    
+    # Attributes copied from the top level of presentation data, in output order
+    _PRESENTATION_ATTRIBUTES = ('slide_count', 'slide_size', 'sections', 'metadata')
+    
+    # Keys that mark data without 'slides' as a single slide to be filtered
+    _SINGLE_SLIDE_MARKER_KEYS = ('title', 'subtitle', 'text', 'tables', 'images', 'layout', 'notes', 'object_counts')
+    
+    # The processor holds no per-instance state
+    __slots__ = ()
+    
     def __init__(self):
         """Initialize the attribute processor."""
         pass
@@ -45,53 +85,93 @@ class AttributeProcessor:
             ValueError: If invalid attribute types are specified
         """
         try:
-            # Validate requested attributes
-            invalid_attrs = self._validate_attributes(requested_attributes)
-            if invalid_attrs:
-                raise ValueError(f"Invalid attribute types: {invalid_attrs}. Valid options: {sorted(self.VALID_ATTRIBUTES)}")
-            
             # If no attributes specified, return all data
             if not requested_attributes:
                 return data
             
-            # Convert to set for faster lookup
-            attr_set = set(requested_attributes)
+            attr_set = self._prepare_attribute_set(requested_attributes)
+            return self._filter_attributes_unchecked(data, attr_set)
             
-            # Filter the data
-            filtered_data = {}
-            
-            # Handle presentation-level data
-            if 'slide_count' in attr_set and 'slide_count' in data:
-                filtered_data['slide_count'] = data['slide_count']
-            
-            if 'slide_size' in attr_set and 'slide_size' in data:
-                filtered_data['slide_size'] = data['slide_size']
-            
-            if 'sections' in attr_set and 'sections' in data:
-                filtered_data['sections'] = data['sections']
-            
-            if 'metadata' in attr_set and 'metadata' in data:
-                filtered_data['metadata'] = data['metadata']
-            
-            # Handle slides data
-            if 'slides' in data:
-                filtered_slides = []
-                for slide in data['slides']:
-                    filtered_slide = self.filter_slide_attributes(slide, attr_set)
-                    filtered_slides.append(filtered_slide)
-                filtered_data['slides'] = filtered_slides
+        except Exception as e:
+            logger.error("Failed to filter attributes: %s", e)
+            raise
+    
+    @classmethod
+    def _prepare_attribute_set(cls, requested_attributes: List[str]) -> FrozenSet[str]:
+        """
+        Validate requested attributes once and convert them for filtering.
+        
+        Args:
+            requested_attributes: List of attribute names to include
             
-            # Handle single slide data (when processing individual slides)
-            elif any(attr in data for attr in ['title', 'subtitle', 'text', 'tables', 'images', 'layout', 'notes', 'object_counts']):
-                filtered_data.update(self.filter_slide_attributes(data, attr_set))
+        Returns:
+            Frozen set of interned attribute names
             
-            return filtered_data
+        Raises:
+            ValueError: If invalid attribute types are specified
+        """
+        invalid_attrs = cls._validate_attributes(requested_attributes)
+        if invalid_attrs:
+            raise ValueError(f"Invalid attribute types: {invalid_attrs}. Valid options: {list(cls._SORTED_VALID_ATTRIBUTES)}")
+        
+        # Names parsed from JSON are not interned, so intern them to match the literals used here
+        return frozenset(map(sys.intern, requested_attributes))
+    
+    def _filter_attributes_unchecked(self, data: Dict[str, Any], attr_set: FrozenSet[str]) -> Dict[str, Any]:
+        """
+        Filter data to include only requested attributes, without validation.
+        
+        Args:
+            data: Complete data dictionary
+            attr_set: Attribute set returned by _prepare_attribute_set
             
-        except Exception as e:
-            logger.error(f"Failed to filter attributes: {e}")
-            raise
+        Returns:
+            Filtered data dictionary containing only requested attributes
+        """
+        top_level_keys = self._requested_presentation_keys(attr_set)
+        
+        # Slides may be any iterable; read them once so checking does not consume them
+        slides = data.get('slides')
+        if slides is not None and not isinstance(slides, list):
+            slides = list(slides)
+        is_single_slide = 'slides' not in data and any(
+            attr in data for attr in self._SINGLE_SLIDE_MARKER_KEYS
+        )
+        
+        # Skip filtering entirely when every key present would be kept as-is
+        slide_keys = self._slide_passthrough_keys(attr_set)
+        if 'slides' in data:
+            # Only a list can be handed back unchanged; other iterables are now consumed
+            if (slides is data['slides']
+                    and data.keys() <= {'slides', *top_level_keys}
+                    and not any(self._needs_slide_filtering(slide, slide_keys, attr_set)
+                                for slide in slides)):
+                return data
+        elif is_single_slide:
+            single_slide_keys = slide_keys.union(top_level_keys)
+            if (data.keys() <= single_slide_keys
+                    and not self._needs_slide_filtering(data, single_slide_keys, attr_set)):
+                return data
+        
+        # Filter the data
+        filtered_data = {}
+        
+        # Handle presentation-level data
+        self._copy_keys(data, filtered_data, top_level_keys)
+        
+        # Handle slides data
+        if 'slides' in data:
+            filter_slide = self._compile_slide_filter(attr_set)
+            filtered_data['slides'] = [filter_slide(slide) for slide in slides]
+        
+        # Handle single slide data (when processing individual slides)
+        elif is_single_slide:
+            filtered_data.update(self.filter_slide_attributes(data, attr_set))
+        
+        return filtered_data
     
-    def filter_slide_attributes(self, slide_data: Dict[str, Any], requested_attributes: Set[str]) -> Dict[str, Any]:
+    @classmethod
+    def filter_slide_attributes(cls, slide_data: Dict[str, Any], requested_attributes: Set[str]) -> Dict[str, Any]:
         """
         Filter attributes for a single slide.
         
@@ -102,78 +182,133 @@ class AttributeProcessor:
         Returns:
             Filtered slide data dictionary
         """
-        try:
-            filtered_slide = {}
-            
-            # Always include slide number if present
-            if 'slide_number' in slide_data:
-                filtered_slide['slide_number'] = slide_data['slide_number']
-            
-            # Filter specific attributes
-            if 'title' in requested_attributes and 'title' in slide_data:
-                filtered_slide['title'] = slide_data['title']
-            
-            if 'subtitle' in requested_attributes and 'subtitle' in slide_data:
-                filtered_slide['subtitle'] = slide_data['subtitle']
-            
-            if 'text' in requested_attributes:
-                # Include text-related data
-                if 'text_elements' in slide_data:
-                    filtered_slide['text_elements'] = slide_data['text_elements']
-                if 'content_plain' in slide_data:
-                    filtered_slide['content_plain'] = slide_data['content_plain']
-                if 'content_formatted' in slide_data:
-                    filtered_slide['content_formatted'] = slide_data['content_formatted']
-            
-            if 'text_elements' in requested_attributes and 'text_elements' in slide_data:
-                filtered_slide['text_elements'] = slide_data['text_elements']
+        return cls._compile_slide_filter(frozenset(requested_attributes))(slide_data)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _compile_slide_filter(requested_attributes: FrozenSet[str]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Build a slide filter specialized for a set of requested attributes.
+        
+        All attribute checks are resolved here, once per attribute set, so the
+        returned function only copies the keys it needs.
+        
+        Args:
+            requested_attributes: Set of attribute names to include
             
-            if 'tables' in requested_attributes and 'tables' in slide_data:
-                filtered_slide['tables'] = slide_data['tables']
+        Returns:
+            Function mapping slide data to filtered slide data
+        """
+        copy_keys = AttributeProcessor._slide_copy_plan(requested_attributes)
+        include_images = 'images' in requested_attributes
+        
+        def filter_slide(slide_data: Dict[str, Any]) -> Dict[str, Any]:
+            # Copy the slide number and the source keys of each requested attribute
+            filtered_slide = {}
+            get = slide_data.get
+            for key in copy_keys:
+                value = get(key, _MISSING)
+                if value is not _MISSING:
+                    filtered_slide[key] = value
             
-            if 'images' in requested_attributes:
+            if include_images:
                 # Include image-related data (always include the key, even if empty)
                 filtered_slide['images'] = slide_data.get('images', [])
                 # Images are counted in object_counts, so include that info
-                if 'object_counts' in slide_data and 'images' in slide_data['object_counts']:
-                    if 'object_counts' not in filtered_slide:
-                        filtered_slide['object_counts'] = {}
-                    filtered_slide['object_counts']['images'] = slide_data['object_counts']['images']
-            
-            if 'layout' in requested_attributes:
-                # Include layout-related data
-                if 'layout_name' in slide_data:
-                    filtered_slide['layout_name'] = slide_data['layout_name']
-                if 'layout_type' in slide_data:
-                    filtered_slide['layout_type'] = slide_data['layout_type']
-                if 'placeholders' in slide_data:
-                    filtered_slide['placeholders'] = slide_data['placeholders']
+                # unless the full object counts were requested
+                object_counts = slide_data.get('object_counts')
+                if object_counts and 'images' in object_counts:
+                    filtered_slide.setdefault('object_counts', {'images': object_counts['images']})
             
-            if 'placeholders' in requested_attributes and 'placeholders' in slide_data:
-                filtered_slide['placeholders'] = slide_data['placeholders']
-            
-            if 'size' in requested_attributes:
-                # Include size-related data
-                if 'slide_size' in slide_data:
-                    filtered_slide['slide_size'] = slide_data['slide_size']
-                # Include position and size info from elements
-                for key in ['position', 'size']:
-                    if key in slide_data:
-                        filtered_slide[key] = slide_data[key]
+            return filtered_slide
+        
+        return filter_slide
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _slide_copy_plan(requested_attributes: FrozenSet[str]) -> Tuple[str, ...]:
+        """
+        Get the ordered slide keys copied for a set of requested attributes.
+        
+        Cached because the same attribute set is applied to every slide.
+        
+        Args:
+            requested_attributes: Set of attribute names to include
             
-            if 'notes' in requested_attributes and 'notes' in slide_data:
-                filtered_slide['notes'] = slide_data['notes']
+        Returns:
+            Tuple of slide data keys, starting with the slide number
+        """
+        keys = {'slide_number': None}
+        for attr, source_keys in AttributeProcessor._ATTRIBUTE_SOURCES.items():
+            if attr in requested_attributes:
+                keys.update(dict.fromkeys(source_keys))
+        return tuple(keys)
+    
+    @classmethod
+    def _slide_passthrough_keys(cls, requested_attributes: FrozenSet[str]) -> FrozenSet[str]:
+        """
+        Get the slide keys that filter_slide_attributes copies unchanged.
+        
+        Args:
+            requested_attributes: Set of attribute names to include
             
-            if 'object_counts' in requested_attributes and 'object_counts' in slide_data:
-                filtered_slide['object_counts'] = slide_data['object_counts']
+        Returns:
+            Set of slide data keys kept for the requested attributes
+        """
+        keys = set(cls._slide_copy_plan(requested_attributes))
+        if 'images' in requested_attributes:
+            keys.add('images')
+        return frozenset(keys)
+    
+    @staticmethod
+    def _needs_slide_filtering(slide_data: Dict[str, Any], passthrough_keys: FrozenSet[str],
+                               requested_attributes: Set[str]) -> bool:
+        """
+        Check whether filtering would change a slide.
+        
+        Args:
+            slide_data: Complete slide data dictionary
+            passthrough_keys: Keys kept unchanged for the requested attributes
+            requested_attributes: Set of attribute names to include
             
-            return filtered_slide
+        Returns:
+            True if the filtered slide would differ from slide_data
+        """
+        if not slide_data.keys() <= passthrough_keys:
+            return True
+        # The images key is added with a default value when missing
+        return 'images' in requested_attributes and 'images' not in slide_data
+    
+    @classmethod
+    def _requested_presentation_keys(cls, requested_attributes: FrozenSet[str]) -> Tuple[str, ...]:
+        """
+        Get the requested presentation-level attributes in output order.
+        
+        Args:
+            requested_attributes: Set of attribute names to include
             
-        except Exception as e:
-            logger.warning(f"Failed to filter slide attributes: {e}")
-            return slide_data
+        Returns:
+            Tuple of requested presentation-level keys
+        """
+        return tuple(key for key in cls._PRESENTATION_ATTRIBUTES if key in requested_attributes)
+    
+    @staticmethod
+    def _copy_keys(source: Dict[str, Any], target: Dict[str, Any], keys: Tuple[str, ...]) -> None:
+        """
+        Copy the given keys from source into target where present.
+        
+        Args:
+            source: Dictionary to copy values from
+            target: Dictionary to copy values into
+            keys: Keys to copy
+        """
+        for key in keys:
+            value = source.get(key, _MISSING)
+            if value is not _MISSING:
+                target[key] = value
     
-    def _validate_attributes(self, requested_attributes: List[str]) -> List[str]:
+    @classmethod
+    def _validate_attributes(cls, requested_attributes: List[str]) -> List[str]:
         """
         Validate that all requested attributes are valid.
         
@@ -181,22 +316,19 @@ class AttributeProcessor:
             requested_attributes: List of attribute names to validate
             
         Returns:
-            List of invalid attribute names
+            List of invalid attribute names, in request order
         """
-        invalid_attrs = []
-        for attr in requested_attributes:
-            if attr not in self.VALID_ATTRIBUTES:
-                invalid_attrs.append(attr)
-        return invalid_attrs
+        return [attr for attr in requested_attributes if attr not in cls.VALID_ATTRIBUTES]
     
-    def get_available_attributes(self) -> List[str]:
+    @classmethod
+    def get_available_attributes(cls) -> List[str]:
         """
         Get list of all available attribute types.
         
         Returns:
             Sorted list of valid attribute names
         """
-        return sorted(self.VALID_ATTRIBUTES)
+        return list(cls._SORTED_VALID_ATTRIBUTES)
     
     def process_slide_attributes(self, slide_data: Dict[str, Any], attributes: List[str]) -> Dict[str, Any]:
         """
@@ -210,20 +342,28 @@ class AttributeProcessor:
             Processed and filtered slide data
         """
         try:
-            # First filter the attributes
-            filtered_data = self.filter_attributes(slide_data, attributes)
+            # If no attributes specified, return all data
+            if not attributes:
+                return slide_data
+            
+            # Filter the slide directly rather than through the presentation-level entry point
+            attr_set = self._prepare_attribute_set(attributes)
+            filtered_data = {}
+            self._copy_keys(slide_data, filtered_data, self._requested_presentation_keys(attr_set))
+            filtered_data.update(self.filter_slide_attributes(slide_data, attr_set))
             
             # Add computed attributes if requested
-            if 'object_counts' in attributes and 'object_counts' not in filtered_data:
+            if 'object_counts' in attr_set and 'object_counts' not in filtered_data:
                 filtered_data['object_counts'] = self._compute_object_counts(slide_data)
             
             return filtered_data
             
         except Exception as e:
-            logger.error(f"Failed to process slide attributes: {e}")
+            logger.error("Failed to process slide attributes: %s", e)
             return slide_data
     
-    def _compute_object_counts(self, slide_data: Dict[str, Any]) -> Dict[str, int]:
+    @classmethod
+    def _compute_object_counts(cls, slide_data: Dict[str, Any]) -> Dict[str, int]:
         """
         Compute object counts from slide data if not already present.
         
@@ -233,38 +373,23 @@ class AttributeProcessor:
         Returns:
             Dictionary with object counts
         """
-        try:
-            counts = {
-                'shapes': 0,
-                'text_boxes': 0,
-                'images': 0,
-                'tables': 0,
-                'charts': 0,
-                'media': 0,
-                'connectors': 0,
-                'groups': 0
-            }
-            
-            # Count from available data
-            if 'text_elements' in slide_data:
-                counts['text_boxes'] = len(slide_data['text_elements'])
-            
-            if 'tables' in slide_data:
-                counts['tables'] = len(slide_data['tables'])
-            
-            if 'placeholders' in slide_data:
-                counts['shapes'] += len(slide_data['placeholders'])
-            
-            return counts
-            
-        except Exception as e:
-            logger.warning(f"Failed to compute object counts: {e}")
-            return {}
+        counts = dict.fromkeys(cls._OBJECT_COUNT_KEYS, 0)
+        
+        # Count from available data (missing or empty entries count as zero)
+        counts['text_boxes'] = len(slide_data.get('text_elements') or ())
+        counts['tables'] = len(slide_data.get('tables') or ())
+        counts['shapes'] += len(slide_data.get('placeholders') or ())
+        
+        return counts
     
     def create_attribute_summary(self, data: Dict[str, Any], attributes: List[str]) -> Dict[str, Any]:
         """
         Create a summary of requested attributes across all slides.
         
+        Reads raw slide data without filtering it first. ``data['slides']`` may
+        be any iterable, including a generator, so slides never need to be
+        materialized just to be summarized.
+        
         Args:
             data: Complete presentation data
             attributes: List of attribute names to summarize
@@ -280,42 +405,48 @@ class AttributeProcessor:
             }
             
             if 'slides' in data:
-                summary['total_slides'] = len(data['slides'])
+                slide_count = 0
                 
-                # Initialize counters
-                if 'object_counts' in attributes:
-                    summary['summary']['total_objects'] = {
-                        'shapes': 0,
-                        'text_boxes': 0,
-                        'images': 0,
-                        'tables': 0,
-                        'charts': 0,
-                        'media': 0,
-                        'connectors': 0,
-                        'groups': 0
-                    }
+                want_objects = 'object_counts' in attributes
+                want_text = 'text' in attributes
+                want_tables = 'tables' in attributes
                 
-                if 'text' in attributes:
-                    summary['summary']['total_text_elements'] = 0
+                # Accumulate into locals and write the totals back once
+                total_objects = dict.fromkeys(self._OBJECT_COUNT_KEYS, 0)
+                total_text_elements = 0
+                total_tables = 0
                 
-                if 'tables' in attributes:
-                    summary['summary']['total_tables'] = 0
-                
-                # Aggregate data from all slides
+                # Aggregate data from all slides in a single pass
                 for slide in data['slides']:
-                    if 'object_counts' in attributes and 'object_counts' in slide:
-                        for obj_type, count in slide['object_counts'].items():
-                            if obj_type in summary['summary']['total_objects']:
-                                summary['summary']['total_objects'][obj_type] += count
+                    slide_count += 1
+                    
+                    if want_objects:
+                        object_counts = slide.get('object_counts')
+                        if object_counts is not None:
+                            for obj_type, count in object_counts.items():
+                                if obj_type in total_objects:
+                                    total_objects[obj_type] += count
                     
-                    if 'text' in attributes and 'text_elements' in slide:
-                        summary['summary']['total_text_elements'] += len(slide['text_elements'])
+                    if want_text:
+                        text_elements = slide.get('text_elements')
+                        if text_elements is not None:
+                            total_text_elements += len(text_elements)
                     
-                    if 'tables' in attributes and 'tables' in slide:
-                        summary['summary']['total_tables'] += len(slide['tables'])
+                    if want_tables:
+                        tables = slide.get('tables')
+                        if tables is not None:
+                            total_tables += len(tables)
+                
+                summary['total_slides'] = slide_count
+                if want_objects:
+                    summary['summary']['total_objects'] = total_objects
+                if want_text:
+                    summary['summary']['total_text_elements'] = total_text_elements
+                if want_tables:
+                    summary['summary']['total_tables'] = total_tables
             
             return summary
             
         except Exception as e:
-            logger.error(f"Failed to create attribute summary: {e}")
+            logger.error("Failed to create attribute summary: %s", e)
             return {'error': str(e)}
\ No newline at end of file
@@ -169,15 +169,9 @@ class FormattingExtractor:
             )
             
             for shape in shapes:
-                nv_sp_pr = self.content_extractor.xml_parser.find_element_with_namespace(
-                    shape, './/p:nvSpPr'
-                )
-                if nv_sp_pr is not None:
-                    ph = self.content_extractor.xml_parser.find_element_with_namespace(
-                        nv_sp_pr, './/p:ph'
-                    )
-                    if ph is not None and ph.get('type') == 'title':
-                        return self.content_extractor._extract_shape_text_content(shape)
+                ph = self.content_extractor._find_placeholder_element(shape)
+                if ph is not None and ph.get('type') == 'title':
+                    return self.content_extractor._extract_shape_text_content(shape)
             
             return ""
             
@@ -195,37 +195,40 @@ class PresentationAnalyzer:
 
                 # Get slide data sorted numerically
                 slide_files = extractor.get_slide_xml_files_sorted()
-
+                slides = []
                 for i, slide_file in enumerate(slide_files, 1):
                     slide_xml = extractor.read_xml_content(slide_file)
                     if slide_xml:
-                        # Extract comprehensive slide content
-                        slide_info = self.content_extractor.extract_slide_content(slide_xml, i)
-
-                        # Get object counts
-                        root = self.content_extractor.xml_parser.parse_xml_string(slide_xml)
-                        object_counts = self.content_extractor._count_slide_objects(root) if root else {}
-
-                        # Get notes if available
-                        notes_file = f'ppt/notesSlides/notesSlide{i}.xml'
-                        notes_content = ""
-                        try:
-                            notes_xml = extractor.read_xml_content(notes_file)
-                            if notes_xml:
-                                notes_content = self.content_extractor.extract_slide_notes(notes_xml)
-                        except Exception as e:
-                            logger.debug(f"Notes not available for slide {i}: {e}")
-                            # Notes are optional, so we continue without them
-
-                        slide_data = {
-                            'slide_number': i,
-                            'slide_info': slide_info,
-                            'object_counts': object_counts,
-                            'notes': notes_content,
-                            'xml_content': slide_xml
-                        }
-
-                        presentation_data['slides'].append(slide_data)
+                        slides.append((slide_xml, i, extractor.get_content_digest(slide_file)))
+
+                # Extract comprehensive slide content for all slides at once
+                slide_infos = self.content_extractor.extract_slides_batch(slides)
+
+                for (slide_xml, i, _), slide_info in zip(slides, slide_infos):
+                    # Get object counts
+                    root = self.content_extractor.xml_parser.parse_xml_string(slide_xml)
+                    object_counts = self.content_extractor._count_slide_objects(root) if root else {}
+
+                    # Get notes if available
+                    notes_file = f'ppt/notesSlides/notesSlide{i}.xml'
+                    notes_content = ""
+                    try:
+                        notes_xml = extractor.read_xml_content(notes_file)
+                        if notes_xml:
+                            notes_content = self.content_extractor.extract_slide_notes(notes_xml)
+                    except Exception as e:
+                        logger.debug(f"Notes not available for slide {i}: {e}")
+                        # Notes are optional, so we continue without them
+
+                    slide_data = {
+                        'slide_number': i,
+                        'slide_info': slide_info,
+                        'object_counts': object_counts,
+                        'notes': notes_content,
+                        'xml_content': slide_xml
+                    }
+
+                    presentation_data['slides'].append(slide_data)
 
             return presentation_data
 
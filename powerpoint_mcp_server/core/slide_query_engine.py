@@ -178,7 +178,9 @@ class SlideQueryEngine:
                 slide_xml = extractor.read_xml_content(slide_file)
                 if slide_xml:
                     # Extract slide content
-                    slide_info = self.content_extractor.extract_slide_content(slide_xml, i)
+                    slide_info = self.content_extractor.extract_slide_content(
+                        slide_xml, i, content_digest=extractor.get_content_digest(slide_file)
+                    )
                     
                     # Extract notes if available
                     notes_file = f'ppt/notesSlides/notesSlide{i}.xml'
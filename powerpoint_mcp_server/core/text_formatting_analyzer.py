@@ -221,7 +221,7 @@ class TextFormattingAnalyzer:
                             logger.debug(f"No notes found for slide {i}: {e}")
                         
                         # Resolve hyperlinks for this slide
-                        self.content_extractor._resolve_hyperlink_relationships(
+                        text_elements = self.content_extractor._resolve_hyperlink_relationships(
                             extractor, i, slide_info.text_elements
                         )
                         
@@ -230,7 +230,7 @@ class TextFormattingAnalyzer:
                             'slide_number': i,
                             'title': slide_info.title,
                             'subtitle': slide_info.subtitle,
-                            'text_elements': slide_info.text_elements,
+                            'text_elements': text_elements,
                             'tables': slide_info.tables,
                             'notes': notes_content,
                             'section_name': slide_to_section.get(i, None)
@@ -479,19 +479,13 @@ class TextFormattingAnalyzer:
             
             for shape_index, shape in enumerate(shapes):
                 # Check if this is a title placeholder
-                nv_sp_pr = self.content_extractor.xml_parser.find_element_with_namespace(
-                    shape, './/p:nvSpPr'
-                )
-                if nv_sp_pr is not None:
-                    ph = self.content_extractor.xml_parser.find_element_with_namespace(
-                        nv_sp_pr, './/p:ph'
+                ph = self.content_extractor._find_placeholder_element(shape)
+                if ph is not None and ph.get('type') == 'title':
+                    element = self._analyze_shape_text_formatting(
+                        shape, slide_number, ContentType.TITLES, shape_index
                     )
-                    if ph is not None and ph.get('type') == 'title':
-                        element = self._analyze_shape_text_formatting(
-                            shape, slide_number, ContentType.TITLES, shape_index
-                        )
-                        if element:
-                            elements.append(element)
+                    if element:
+                        elements.append(element)
             
             return elements
             
@@ -517,19 +511,10 @@ class TextFormattingAnalyzer:
                 
                 if tx_body is not None:
                     # Check if it's not a title/subtitle placeholder
-                    nv_sp_pr = self.content_extractor.xml_parser.find_element_with_namespace(
-                        shape, './/p:nvSpPr'
+                    ph = self.content_extractor._find_placeholder_element(shape)
+                    is_title_placeholder = (
+                        ph is not None and ph.get('type', '') in ['title', 'subTitle', 'subtitle']
                     )
-                    is_title_placeholder = False
-                    
-                    if nv_sp_pr is not None:
-                        ph = self.content_extractor.xml_parser.find_element_with_namespace(
-                            nv_sp_pr, './/p:ph'
-                        )
-                        if ph is not None:
-                            ph_type = ph.get('type', '')
-                            if ph_type in ['title', 'subTitle', 'subtitle']:
-                                is_title_placeholder = True
                     
                     if not is_title_placeholder:
                         element = self._analyze_shape_text_formatting(
@@ -9,12 +9,21 @@ to parse various XML components of PowerPoint presentations.
 import xml.etree.ElementTree as ET
 from typing import Dict, Optional, List, Any, Iterator
 from pathlib import Path
+import functools
 import logging
 import io
+import re
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Namespace prefix in an XPath step (e.g. the "p:" in ".//p:sp"); Clark-notation
+# names and quoted literals are matched first so they are left untouched
+_PREFIX_PATTERN = re.compile(r'(\{[^}]*\}|\'[^\']*\'|"[^"]*")|\b([A-Za-z_][\w.-]*):(?=[A-Za-z_*])')
+
+# A single descendant step by tag name (e.g. ".//{uri}tbl") after prefix expansion
+_DESCENDANT_TAG_PATTERN = re.compile(r'\.//((?:\{[^}]*\})?[A-Za-z_][\w-]*)')
+
 
 class XMLParser:
     """
@@ -216,7 +225,14 @@ class XMLParser:
             List of matching elements
         """
         try:
-            return root.findall(xpath, self.NAMESPACES)
+            tag = _descendant_tag(xpath)
+            if tag is not None and isinstance(root, ET.Element):
+                # Filter by tag in C; unlike findall, iter() also yields the root itself
+                elements = list(root.iter(tag))
+                if elements and elements[0] is root:
+                    del elements[0]
+                return elements
+            return root.findall(_qualify_xpath(xpath))
         except Exception as e:
             logger.error(f"Failed to find elements with XPath {xpath}: {e}")
             return []
@@ -233,7 +249,13 @@ class XMLParser:
             First matching element, or None if not found
         """
         try:
-            return root.find(xpath, self.NAMESPACES)
+            tag = _descendant_tag(xpath)
+            if tag is not None and isinstance(root, ET.Element):
+                for element in root.iter(tag):
+                    if element is not root:
+                        return element
+                return None
+            return root.find(_qualify_xpath(xpath))
         except Exception as e:
             logger.error(f"Failed to find element with XPath {xpath}: {e}")
             return None
@@ -403,4 +425,53 @@ class XMLParser:
                         
         except Exception as e:
             logger.error(f"Failed to parse XML iteratively from {file_path}: {e}")
-            raise
\ No newline at end of file
+            raise
+
+
+@functools.lru_cache(maxsize=512)
+def _qualify_xpath(xpath: str) -> str:
+    """
+    Expand namespace prefixes in an XPath expression to Clark notation.
+    
+    ElementTree keys its compiled-path cache on the path together with the
+    sorted namespace map, so passing NAMESPACES on every lookup re-sorts the
+    map per call. Resolving prefixes once lets find/findall hit the cache
+    directly.
+    
+    Args:
+        xpath: XPath expression with namespace prefixes (e.g. './/p:sp')
+        
+    Returns:
+        Equivalent expression using '{uri}tag' names
+        
+    Raises:
+        KeyError: If the expression uses an unknown namespace prefix
+    """
+    def expand(match):
+        if match.group(1):
+            return match.group(1)
+        return f"{{{XMLParser.NAMESPACES[match.group(2)]}}}"
+    
+    return _PREFIX_PATTERN.sub(expand, xpath)
+
+
+@functools.lru_cache(maxsize=512)
+def _descendant_tag(xpath: str) -> Optional[str]:
+    """
+    Get the tag searched for by a plain './/tag' XPath expression.
+    
+    Such lookups can use Element.iter(tag), which filters by tag in C instead
+    of going through ElementPath's Python-level selector generators.
+    
+    Args:
+        xpath: XPath expression with namespace prefixes (e.g. './/a:tbl')
+        
+    Returns:
+        Clark-notation tag, or None if the expression is not a single
+        descendant-by-tag step
+        
+    Raises:
+        KeyError: If the expression uses an unknown namespace prefix
+    """
+    match = _DESCENDANT_TAG_PATTERN.fullmatch(_qualify_xpath(xpath))
+    return match.group(1) if match else None
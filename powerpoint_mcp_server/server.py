@@ -574,7 +574,9 @@ class PowerPointMCPServer:
                     slide_xml = extractor.read_xml_content(slide_file)
                     if slide_xml:
                         # Extract slide content
-                        slide_info = self.content_extractor.extract_slide_content(slide_xml, i)
+                        slide_info = self.content_extractor.extract_slide_content(
+                            slide_xml, i, content_digest=extractor.get_content_digest(slide_file)
+                        )
 
                         # Try to get notes for this slide using proper mapping only
                         notes_content = ""
@@ -596,7 +598,7 @@ class PowerPointMCPServer:
 
                         # Resolve hyperlink relationships
                         logger.info(f"Resolving hyperlinks for slide {i}")
-                        self.content_extractor._resolve_hyperlink_relationships(
+                        text_elements = self.content_extractor._resolve_hyperlink_relationships(
                             extractor, i, slide_info.text_elements
                         )
 
@@ -608,7 +610,7 @@ class PowerPointMCPServer:
                             'layout_name': slide_info.layout_name,
                             'layout_type': slide_info.layout_type,
                             'placeholders': slide_info.placeholders,
-                            'text_elements': slide_info.text_elements,
+                            'text_elements': text_elements,
                             'tables': slide_info.tables,
                             'notes': notes_content,
                             'object_counts': self.content_extractor._count_slide_objects(
@@ -650,11 +652,13 @@ class PowerPointMCPServer:
                     raise ValueError(f"Could not read slide {slide_number}")
 
                 # Extract slide content
-                slide_info = self.content_extractor.extract_slide_content(slide_xml, slide_number)
+                slide_info = self.content_extractor.extract_slide_content(
+                    slide_xml, slide_number, content_digest=extractor.get_content_digest(slide_file)
+                )
 
                 # Resolve hyperlink relationships
                 logger.info(f"Resolving hyperlinks for slide {slide_number}")
-                self.content_extractor._resolve_hyperlink_relationships(
+                text_elements = self.content_extractor._resolve_hyperlink_relationships(
                     extractor, slide_number, slide_info.text_elements
                 )
 
@@ -689,7 +693,7 @@ class PowerPointMCPServer:
                     'layout_name': slide_info.layout_name,
                     'layout_type': slide_info.layout_type,
                     'placeholders': slide_info.placeholders,
-                    'text_elements': slide_info.text_elements,
+                    'text_elements': text_elements,
                     'tables': slide_info.tables,
                     'notes': notes_content,
                     'object_counts': self.content_extractor._count_slide_objects(
@@ -11,6 +11,8 @@ class ToolHelpSystem:
     
     def __init__(self):
         self.tool_docs = self._initialize_tool_docs()
+        # Tool docs are static, so formatted help text is built once per tool
+        self._help_text_cache: Dict[str, str] = {}
     
     def _initialize_tool_docs(self) -> Dict[str, Dict[str, Any]]:
         """Initialize comprehensive tool documentation."""
@@ -237,6 +239,10 @@ class ToolHelpSystem:
     
     def format_help_text(self, tool_name: str) -> str:
         """Format comprehensive help text for a tool."""
+        cached_text = self._help_text_cache.get(tool_name)
+        if cached_text is not None:
+            return cached_text
+        
         tool_doc = self.get_tool_help(tool_name)
         if not tool_doc:
             return f"No help available for tool: {tool_name}"
@@ -283,7 +289,9 @@ class ToolHelpSystem:
             for note in notes:
                 help_text.append(f"- {note}")
         
-        return "\n".join(help_text)
+        formatted_text = "\n".join(help_text)
+        self._help_text_cache[tool_name] = formatted_text
+        return formatted_text
     
     def _format_schema(self, schema: Dict[str, Any], indent: int = 0) -> str:
         """Format schema documentation recursively."""
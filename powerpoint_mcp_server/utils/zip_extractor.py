@@ -1,6 +1,8 @@
 """ZIP extraction utilities for PowerPoint files."""
 
+import hashlib
 import os
+import re
 import tempfile
 import zipfile
 from pathlib import Path
@@ -9,6 +11,9 @@ from contextlib import contextmanager
 
 from .file_validator import FileValidator, FileValidationError
 
+# Slide number in an archive path such as 'ppt/slides/slide12.xml'
+_SLIDE_NUMBER_PATTERN = re.compile(r'slide(\d+)\.xml$')
+
 
 class ZipExtractionError(Exception):
     """Custom exception for ZIP extraction errors."""
@@ -31,6 +36,7 @@ class ZipExtractor:
         self.file_path = file_path
         self.temp_dir: Optional[str] = None
         self._extracted_files: Dict[str, str] = {}
+        self._content_digests: Dict[str, str] = {}
         
         # Validate file before proceeding
         FileValidator.validate_file_strict(file_path)
@@ -56,6 +62,13 @@ class ZipExtractor:
             # Create temporary directory
             self.temp_dir = tempfile.mkdtemp(prefix='pptx_extract_')
             
+            # Identify this version of the archive so member fingerprints cannot
+            # collide with another file's; a rewritten file changes mtime or size
+            stat = os.stat(self.file_path)
+            archive_id = hashlib.sha1(
+                f"{os.path.abspath(self.file_path)}\0{stat.st_mtime_ns}\0{stat.st_size}".encode()
+            ).hexdigest()[:16]
+            
             # Extract ZIP archive
             with zipfile.ZipFile(self.file_path, 'r') as zip_file:
                 zip_file.extractall(self.temp_dir)
@@ -65,6 +78,10 @@ class ZipExtractor:
                     if not file_info.is_dir():
                         extracted_path = os.path.join(self.temp_dir, file_info.filename)
                         self._extracted_files[file_info.filename] = extracted_path
+                        # CRC-32 and size from the central directory identify the member for free
+                        self._content_digests[file_info.filename] = (
+                            f"{archive_id}{file_info.CRC:08x}{file_info.file_size:x}"
+                        )
                         
         except zipfile.BadZipFile as e:
             raise ZipExtractionError(f"Invalid ZIP file: {str(e)}")
@@ -129,6 +146,27 @@ class ZipExtractor:
         except Exception as e:
             raise ZipExtractionError(f"Failed to read XML file {xml_path}: {str(e)}")
     
+    def get_content_digest(self, xml_path: str) -> Optional[str]:
+        """
+        Get a content fingerprint for a file in the archive.
+        
+        The fingerprint combines the CRC-32 and uncompressed size stored in the
+        ZIP central directory with the archive's path, modification time and
+        size, so no file data has to be read or hashed. Cache keys built from it
+        are shared by every presentation the process opens; scoping them to the
+        archive keeps a CRC-32 collision in another file from matching.
+        
+        Args:
+            xml_path: Path within the archive (e.g., 'ppt/slides/slide1.xml')
+            
+        Returns:
+            Fingerprint string, or None if file not found
+        """
+        if not self._extracted_files:
+            raise ZipExtractionError("Archive not extracted. Use extract_archive() context manager.")
+        
+        return self._content_digests.get(xml_path)
+    
     def list_archive_contents(self) -> List[str]:
         """
         List all files in the extracted archive.
@@ -168,8 +206,7 @@ class ZipExtractor:
         
         def extract_slide_number(slide_path):
             """Extract slide number from path like 'ppt/slides/slide1.xml'"""
-            import re
-            match = re.search(r'slide(\d+)\.xml$', slide_path)
+            match = _SLIDE_NUMBER_PATTERN.search(slide_path)
             return int(match.group(1)) if match else 0
         
         return sorted(slide_files_dict.keys(), key=extract_slide_number)
@@ -214,6 +251,7 @@ class ZipExtractor:
                 shutil.rmtree(self.temp_dir)
                 self.temp_dir = None
                 self._extracted_files.clear()
+                self._content_digests.clear()
             except Exception as e:
                 # Log error but don't raise - cleanup is best effort
                 import logging
@@ -10,7 +10,7 @@ import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, AsyncIterator
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
 
@@ -99,14 +99,24 @@ class MCPTestClient:
         except Exception as e:
             logger.error(f"Error during disconnect: {e}")
 
+    async def iter_tools(self) -> AsyncIterator[Any]:
+        """Yield tools from the server page by page, following pagination cursors."""
+        if not self.connected or not self.session:
+            raise RuntimeError("Not connected to MCP server")
+
+        cursor = None
+        while True:
+            page = await self.session.list_tools(cursor=cursor)
+            for tool in page.tools:
+                yield tool
+            cursor = getattr(page, 'nextCursor', None)
+            if not cursor:
+                break
+
     async def list_available_tools(self) -> List[str]:
         """Get list of available tools from server."""
         try:
-            if not self.connected or not self.session:
-                raise RuntimeError("Not connected to MCP server")
-
-            tools = await self.session.list_tools()
-            tool_names = [tool.name for tool in tools.tools]
+            tool_names = [tool.name async for tool in self.iter_tools()]
             logger.info(f"Available tools: {tool_names}")
             return tool_names
 
@@ -0,0 +1,215 @@
+"""
+Unit tests for AttributeProcessor class.
+"""
+
+import pytest
+
+from powerpoint_mcp_server.core.attribute_processor import AttributeProcessor
+
+
+def make_slide(**overrides):
+    """Build a representative slide dictionary."""
+    slide = {
+        'slide_number': 1,
+        'title': 'Quarterly Results',
+        'subtitle': 'Q3',
+        'text_elements': [{'content_plain': 'Revenue up'}],
+        'content_plain': 'Revenue up',
+        'tables': [{'rows': 2, 'columns': 2}],
+        'images': [{'name': 'chart.png'}],
+        'layout_name': 'Title and Content',
+        'layout_type': 'obj',
+        'placeholders': [{'type': 'title'}],
+        'slide_size': {'width': 9144000, 'height': 6858000},
+        'notes': 'Speaker notes',
+        'object_counts': {'shapes': 3, 'images': 1, 'tables': 1}
+    }
+    slide.update(overrides)
+    return slide
+
+
+class TestAttributeProcessor:
+    """Test cases for AttributeProcessor class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.processor = AttributeProcessor()
+
+    def test_filter_single_slide_title_subtitle(self):
+        """Test filtering a single slide down to title and subtitle."""
+        result = self.processor.filter_attributes(make_slide(), ['title', 'subtitle'])
+
+        assert result == {'slide_number': 1, 'title': 'Quarterly Results', 'subtitle': 'Q3'}
+
+    def test_filter_text_includes_text_keys(self):
+        """Test that the text attribute pulls in all text-related keys."""
+        result = self.processor.filter_attributes(make_slide(), ['text'])
+
+        assert result['text_elements'] == [{'content_plain': 'Revenue up'}]
+        assert result['content_plain'] == 'Revenue up'
+        assert 'content_formatted' not in result
+        assert 'title' not in result
+
+    def test_filter_layout_and_size(self):
+        """Test composite layout and size attributes."""
+        result = self.processor.filter_attributes(make_slide(), ['layout', 'size'])
+
+        assert result['layout_name'] == 'Title and Content'
+        assert result['layout_type'] == 'obj'
+        assert result['placeholders'] == [{'type': 'title'}]
+        assert result['slide_size'] == {'width': 9144000, 'height': 6858000}
+
+    def test_filter_images_adds_image_count(self):
+        """Test that requesting images includes the image object count."""
+        result = self.processor.filter_attributes(make_slide(), ['images'])
+
+        assert result['images'] == [{'name': 'chart.png'}]
+        assert result['object_counts'] == {'images': 1}
+
+    def test_filter_images_defaults_to_empty_list(self):
+        """Test that the images key is always present when requested."""
+        slide = make_slide()
+        del slide['images']
+
+        result = self.processor.filter_attributes(slide, ['images', 'title'])
+
+        assert result['images'] == []
+
+    def test_filter_images_with_object_counts_keeps_full_counts(self):
+        """Test that explicitly requested object counts are not truncated."""
+        result = self.processor.filter_attributes(make_slide(), ['images', 'object_counts'])
+
+        assert result['object_counts'] == {'shapes': 3, 'images': 1, 'tables': 1}
+
+    def test_filter_presentation_level_data(self):
+        """Test filtering presentation data with multiple slides."""
+        data = {
+            'slide_count': 2,
+            'slide_size': {'width': 1, 'height': 1},
+            'metadata': {'author': 'someone'},
+            'slides': [make_slide(), make_slide(slide_number=2, title='Next')]
+        }
+
+        result = self.processor.filter_attributes(data, ['title', 'slide_count'])
+
+        assert result['slide_count'] == 2
+        assert 'metadata' not in result
+        assert 'slide_size' not in result
+        assert result['slides'] == [
+            {'slide_number': 1, 'title': 'Quarterly Results'},
+            {'slide_number': 2, 'title': 'Next'}
+        ]
+
+    def test_filter_empty_attributes_returns_data(self):
+        """Test that no requested attributes returns the data unchanged."""
+        data = make_slide()
+
+        assert self.processor.filter_attributes(data, []) is data
+
+    def test_filter_returns_data_when_nothing_to_drop(self):
+        """Test that a filter keeping every present key returns the data as-is."""
+        data = {
+            'slide_count': 1,
+            'slides': [{'slide_number': 1, 'title': 'Only', 'images': []}]
+        }
+
+        result = self.processor.filter_attributes(data, ['slide_count', 'title', 'images'])
+
+        assert result is data
+
+    def test_filter_single_slide_missing_images_is_not_short_circuited(self):
+        """Test that the images default is still applied when short-circuit checks fail."""
+        slide = {'slide_number': 1, 'title': 'Only'}
+
+        result = self.processor.filter_attributes(slide, ['title', 'images'])
+
+        assert result == {'slide_number': 1, 'title': 'Only', 'images': []}
+        assert result is not slide
+
+    def test_filter_accepts_slide_generator(self):
+        """Test that slides given as a generator are all kept when checked for a no-op filter."""
+        slides = [{'slide_number': n, 'title': f'Slide {n}'} for n in (1, 2, 3)]
+
+        result = self.processor.filter_attributes({'slides': (s for s in slides)}, ['title'])
+
+        assert result == {'slides': slides}
+
+    def test_filter_single_slide_passthrough_matches_filter(self):
+        """Test that unrelated keys do not change the result for data without slide markers."""
+        data = {'slide_number': 1, 'text_elements': [{'content_plain': 'Hello'}]}
+
+        result = self.processor.filter_attributes(data, ['text'])
+
+        assert result == {}
+        assert self.processor.filter_attributes({**data, 'extra': 1}, ['text']) == result
+
+    def test_filter_invalid_attributes_raises(self):
+        """Test that invalid attribute names are rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            self.processor.filter_attributes(make_slide(), ['title', 'bogus'])
+
+        assert 'bogus' in str(exc_info.value)
+
+    def test_filter_invalid_attributes_keeps_request_order(self):
+        """Test that invalid names are reported in request order, duplicates included."""
+        with pytest.raises(ValueError) as exc_info:
+            self.processor.filter_attributes(make_slide(), ['zeta', 'title', 'alpha', 'zeta'])
+
+        assert "['zeta', 'alpha', 'zeta']" in str(exc_info.value)
+
+    def test_filter_mixed_type_invalid_attributes_raises_value_error(self):
+        """Test that invalid names of mixed types still raise ValueError."""
+        with pytest.raises(ValueError) as exc_info:
+            self.processor.filter_attributes(make_slide(), ['foo', 1])
+
+        assert "['foo', 1]" in str(exc_info.value)
+
+    def test_get_available_attributes_sorted(self):
+        """Test that available attributes are returned sorted."""
+        attributes = self.processor.get_available_attributes()
+
+        assert attributes == sorted(AttributeProcessor.VALID_ATTRIBUTES)
+
+    def test_process_slide_attributes_computes_object_counts(self):
+        """Test that missing object counts are computed on demand."""
+        slide = make_slide()
+        del slide['object_counts']
+
+        result = self.processor.process_slide_attributes(slide, ['title', 'object_counts'])
+
+        assert result['title'] == 'Quarterly Results'
+        assert result['object_counts']['text_boxes'] == 1
+        assert result['object_counts']['tables'] == 1
+        assert result['object_counts']['shapes'] == 1
+        assert result['object_counts']['images'] == 0
+
+    def test_process_slide_attributes_does_not_modify_input(self):
+        """Test that computed object counts are not written into the input slide."""
+        slide = {'slide_number': 1, 'title': 'Only'}
+
+        result = self.processor.process_slide_attributes(slide, ['title', 'object_counts'])
+
+        assert 'object_counts' in result
+        assert 'object_counts' not in slide
+
+    def test_create_attribute_summary(self):
+        """Test aggregation of attributes across slides."""
+        data = {'slides': [make_slide(), make_slide(slide_number=2)]}
+
+        summary = self.processor.create_attribute_summary(data, ['object_counts', 'text', 'tables'])
+
+        assert summary['total_slides'] == 2
+        assert summary['summary']['total_objects']['shapes'] == 6
+        assert summary['summary']['total_objects']['images'] == 2
+        assert summary['summary']['total_objects']['charts'] == 0
+        assert summary['summary']['total_text_elements'] == 2
+        assert summary['summary']['total_tables'] == 2
+
+    def test_create_attribute_summary_accepts_slide_generator(self):
+        """Test that slides can be streamed into the summary."""
+        data = {'slides': (make_slide(slide_number=n) for n in range(1, 4))}
+
+        summary = self.processor.create_attribute_summary(data, ['tables'])
+
+        assert summary['total_slides'] == 3
+        assert summary['summary'] == {'total_tables': 3}
@@ -0,0 +1,124 @@
+"""Tests for server configuration management."""
+
+import dataclasses
+
+import pytest
+
+from powerpoint_mcp_server.config import ServerConfig, ConfigManager, get_config, get_config_manager
+
+
+class TestServerConfig:
+    """Test cases for ServerConfig."""
+
+    def test_from_env_reads_environment(self, monkeypatch):
+        """Test that environment variables are picked up."""
+        monkeypatch.setenv('POWERPOINT_MCP_LOG_LEVEL', 'DEBUG')
+        monkeypatch.setenv('POWERPOINT_MCP_MAX_FILE_SIZE', '25')
+        monkeypatch.setenv('POWERPOINT_MCP_CACHE_ENABLED', 'false')
+
+        config = ServerConfig.from_env()
+
+        assert config.log_level == 'DEBUG'
+        assert config.max_file_size_mb == 25
+        assert config.cache_enabled is False
+
+    def test_defaults_ignore_environment(self, monkeypatch):
+        """Test that direct construction uses plain defaults."""
+        monkeypatch.setenv('POWERPOINT_MCP_DEBUG', 'true')
+
+        config = ServerConfig()
+
+        assert config.debug_mode is False
+        assert config.log_level == 'WARNING'
+        assert config.max_file_size_mb == 100
+
+    def test_from_env_replaces_invalid_values(self, monkeypatch):
+        """Test that invalid environment values fall back to defaults."""
+        monkeypatch.setenv('POWERPOINT_MCP_LOG_LEVEL', 'VERBOSE')
+        monkeypatch.setenv('POWERPOINT_MCP_MAX_FILE_SIZE', '0')
+        monkeypatch.setenv('POWERPOINT_MCP_TIMEOUT', '-5')
+        monkeypatch.setenv('POWERPOINT_MCP_CACHE_TTL', '0')
+
+        config = ServerConfig.from_env()
+
+        assert config.log_level == 'INFO'
+        assert config.max_file_size_mb == 100
+        assert config.processing_timeout_seconds == 300
+        assert config.cache_ttl_seconds == 3600
+
+    def test_max_file_size_bytes_is_precomputed(self):
+        """Test that the byte limit tracks the configured megabytes."""
+        config = dataclasses.replace(ServerConfig.from_env(), max_file_size_mb=3)
+
+        assert config.max_file_size_bytes == 3 * 1024 * 1024
+
+    def test_config_is_immutable(self):
+        """Test that configuration instances cannot be mutated."""
+        config = ServerConfig.from_env()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.log_level = 'DEBUG'
+
+
+class TestConfigManager:
+    """Test cases for ConfigManager."""
+
+    def test_update_config_replaces_instance(self):
+        """Test that updates produce a new validated configuration."""
+        manager = ConfigManager(ServerConfig.from_env())
+        original = manager.get_config()
+
+        manager.update_config(max_file_size_mb=10, debug_mode=True)
+
+        assert manager.get_config() is not original
+        assert manager.get_config().max_file_size_mb == 10
+        assert manager.get_config().max_file_size_bytes == 10 * 1024 * 1024
+        assert manager.get_config().debug_mode is True
+
+    def test_update_config_validates_values(self):
+        """Test that invalid updates are replaced by defaults."""
+        manager = ConfigManager(ServerConfig.from_env())
+
+        manager.update_config(log_level='nonsense', cache_ttl_seconds=-1)
+
+        assert manager.get_config().log_level == 'INFO'
+        assert manager.get_config().cache_ttl_seconds == 3600
+
+    def test_update_config_ignores_unknown_keys(self):
+        """Test that unknown keys are ignored."""
+        manager = ConfigManager(ServerConfig.from_env())
+
+        manager.update_config(not_a_setting=1)
+
+        assert not hasattr(manager.get_config(), 'not_a_setting')
+
+    def test_update_config_ignores_derived_keys(self):
+        """Test that derived values cannot be updated directly."""
+        manager = ConfigManager(ServerConfig.from_env())
+        original = manager.get_config()
+
+        manager.update_config(max_file_size_bytes=5, debug_mode=True)
+
+        assert manager.get_config().max_file_size_bytes == original.max_file_size_bytes
+        assert manager.get_config().debug_mode is True
+
+
+class TestGlobalConfig:
+    """Test cases for the module-level configuration accessors."""
+
+    def test_get_config_is_cached(self):
+        """Test that repeated calls return the same instance."""
+        assert get_config() is get_config()
+        assert get_config_manager() is get_config_manager()
+
+    def test_get_config_reflects_updates(self):
+        """Test that update_config invalidates the cached configuration."""
+        manager = get_config_manager()
+        original = manager.get_config()
+        try:
+            get_config()
+            manager.update_config(processing_timeout_seconds=42)
+            assert get_config().processing_timeout_seconds == 42
+        finally:
+            manager.config = original
+            get_config.cache_clear()
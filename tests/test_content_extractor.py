@@ -5,11 +5,14 @@ Tests slide content extraction functionality including layout information,
 placeholder extraction, and basic slide structure parsing.
 """
 
+import dataclasses
+import multiprocessing
 import pytest
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import Mock, patch
 
-from powerpoint_mcp_server.core.content_extractor import ContentExtractor, SlideInfo, PlaceholderInfo, TextElement
+from powerpoint_mcp_server.core.content_extractor import ContentExtractor, SlideInfo, PlaceholderInfo, TextElement, _TextFormatting
 
 
 class TestContentExtractor:
@@ -237,6 +240,87 @@ class TestContentExtractor:
         assert result.slide_number == 6
         assert len(result.placeholders) == 0
     
+    def test_extract_slide_content_malformed_geometry(self):
+        """Test that a malformed transform value counts as 0 without losing the shape."""
+        slide_xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+               xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <p:cSld>
+                <p:spTree>
+                    <p:sp>
+                        <p:nvSpPr><p:cNvPr id="2" name="Title"/><p:cNvSpPr/><p:nvPr><p:ph type="title"/></p:nvPr></p:nvSpPr>
+                        <p:spPr><a:xfrm><a:off x="abc" y="20"/><a:ext cx="100" cy="50"/></a:xfrm></p:spPr>
+                        <p:txBody><a:p><a:r><a:t>Hello</a:t></a:r></a:p></p:txBody>
+                    </p:sp>
+                    <p:sp>
+                        <p:txBody><a:p><a:r><a:t>World</a:t></a:r></a:p></p:txBody>
+                    </p:sp>
+                </p:spTree>
+            </p:cSld>
+        </p:sld>"""
+        
+        result = self.extractor.extract_slide_content(slide_xml, 1)
+        
+        assert result.title == "Hello"
+        assert [elem['content_plain'] for elem in result.text_elements] == ["Hello", "World"]
+        assert len(result.placeholders) == 1
+        assert result.placeholders[0]['position'] == (0, 20)
+        assert result.placeholders[0]['size'] == (100, 50)
+        assert [elem['content_plain'] for elem in self.extractor.extract_text_elements(slide_xml, 1)] == ["Hello", "World"]
+    
+    def test_extract_text_elements_skips_failing_shape(self):
+        """Test that a shape that fails to extract does not discard the rest of the slide."""
+        slide_xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+               xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <p:cSld>
+                <p:spTree>
+                    <p:sp>
+                        <p:txBody><a:p><a:r><a:t>Broken</a:t></a:r></a:p></p:txBody>
+                    </p:sp>
+                    <p:sp>
+                        <p:txBody><a:p><a:r><a:t>Intact</a:t></a:r></a:p></p:txBody>
+                    </p:sp>
+                </p:spTree>
+            </p:cSld>
+        </p:sld>"""
+        extract_shape = self.extractor._extract_text_element_from_shape
+        
+        def fail_on_first_shape(shape, *args, **kwargs):
+            if shape.find('.//{http://schemas.openxmlformats.org/drawingml/2006/main}t').text == "Broken":
+                raise RuntimeError("unexpected shape structure")
+            return extract_shape(shape, *args, **kwargs)
+        
+        with patch.object(self.extractor, '_extract_text_element_from_shape', side_effect=fail_on_first_shape):
+            result = self.extractor.extract_text_elements(slide_xml, 1)
+            streamed = self.extractor.extract_slide_content(slide_xml, 1)
+        
+        assert [elem['content_plain'] for elem in result] == ["Intact"]
+        assert [elem['content_plain'] for elem in streamed.text_elements] == ["Intact"]
+    
+    def test_extract_slide_content_large_slide(self):
+        """Test that slides larger than the parser's streaming threshold are fully extracted."""
+        shape_xml = """<p:sp>
+            <p:nvSpPr><p:cNvPr id="2" name="Text"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>
+            <p:spPr/>
+            <p:txBody><a:p><a:r><a:t>Shape text {0} with some padding words</a:t></a:r></a:p></p:txBody>
+        </p:sp>"""
+        slide_xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+            'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+            '<p:cSld><p:spTree>'
+            + ''.join(shape_xml.format(i) for i in range(5000))
+            + '</p:spTree></p:cSld></p:sld>'
+        )
+        assert len(slide_xml) > 1024 * 1024
+        
+        result = self.extractor.extract_slide_content(slide_xml, 1)
+        
+        assert len(result.text_elements) == 5000
+        assert result.text_elements[-1]['content_plain'] == 'Shape text 4999 with some padding words'
+        assert result.layout_type == "blank"
+    
     def test_determine_layout_type_title_and_content(self):
         """Test layout type determination for title and content layout."""
         slide_xml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -421,6 +505,51 @@ class TestContentExtractor:
         assert position == (0, 0)
         assert size == (0, 0)
     
+    def test_extract_shape_transform_partial_attributes(self):
+        """Test that missing or empty transform attributes default to zero."""
+        shape_xml = """<p:sp xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+                            xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <p:spPr>
+                <a:xfrm>
+                    <a:off x="914400" y=""/>
+                    <a:ext cx="4572000"/>
+                </a:xfrm>
+            </p:spPr>
+        </p:sp>"""
+        
+        root = ET.fromstring(shape_xml)
+        position, size = self.extractor._extract_shape_transform(root)
+        
+        assert position == (914400, 0)
+        assert size == (4572000, 0)
+    
+    def test_extract_graphic_frame_transform(self):
+        """Test reading a graphic frame's direct p:xfrm and the nested a:xfrm fallback."""
+        namespaces = ('xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+                      'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"')
+        direct = ET.fromstring(f"""<p:graphicFrame {namespaces}>
+            <p:xfrm><a:off x="10" y="20"/><a:ext cx="30" cy="40"/></p:xfrm>
+        </p:graphicFrame>""")
+        nested = ET.fromstring(f"""<p:graphicFrame {namespaces}>
+            <a:graphic><a:xfrm><a:off x="1" y="2"/><a:ext cx="3" cy="4"/></a:xfrm></a:graphic>
+        </p:graphicFrame>""")
+        
+        assert self.extractor._extract_graphic_frame_transform(direct) == ((10, 20), (30, 40))
+        assert self.extractor._extract_graphic_frame_transform(nested) == ((1, 2), (3, 4))
+    
+    def test_find_descendant(self):
+        """Test finding nested descendants by Clark-notation tag."""
+        a_ns = "http://schemas.openxmlformats.org/drawingml/2006/main"
+        r_pr = ET.fromstring(f"""<a:rPr xmlns:a="{a_ns}">
+            <a:solidFill><a:srgbClr val="FF0000"/></a:solidFill>
+        </a:rPr>""")
+        
+        found = self.extractor._find_descendant(r_pr, f"{{{a_ns}}}srgbClr")
+        
+        assert found is not None and found.get('val') == "FF0000"
+        assert self.extractor._find_descendant(r_pr, f"{{{a_ns}}}rPr") is None
+        assert self.extractor._find_descendant(r_pr, f"{{{a_ns}}}schemeClr") is None
+    
     def test_extract_shape_text_content_no_text(self):
         """Test extracting text from shape without text body."""
         shape_xml = """<p:sp xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
@@ -444,6 +573,43 @@ class TestContentExtractor:
         
         assert result is None
     
+    def test_extract_single_placeholder_direct_child_path(self):
+        """Test placeholder and transform lookup via the standard child paths."""
+        shape_xml = """<p:sp xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+              xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <p:nvSpPr>
+                <p:cNvPr id="1" name="Title 1"/>
+                <p:cNvSpPr/>
+                <p:nvPr><p:ph type="title"/></p:nvPr>
+            </p:nvSpPr>
+            <p:spPr>
+                <a:xfrm><a:off x="10" y="20"/><a:ext cx="300" cy="40"/></a:xfrm>
+            </p:spPr>
+            <p:txBody><a:p><a:r><a:t>Heading</a:t></a:r></a:p></p:txBody>
+        </p:sp>"""
+        
+        root = ET.fromstring(shape_xml)
+        result = self.extractor._extract_single_placeholder(root)
+        
+        assert result.placeholder_type == "title"
+        assert result.position == (10, 20)
+        assert result.size == (300, 40)
+        assert result.content == "Heading"
+    
+    def test_extract_single_placeholder_nested_fallback(self):
+        """Test that non-standard nesting still finds the placeholder."""
+        shape_xml = """<p:sp xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
+            <p:wrapper>
+                <p:nvSpPr><p:nvPr><p:ph type="body"/></p:nvPr></p:nvSpPr>
+            </p:wrapper>
+        </p:sp>"""
+        
+        root = ET.fromstring(shape_xml)
+        result = self.extractor._extract_single_placeholder(root)
+        
+        assert result is not None
+        assert result.placeholder_type == "body"
+    
     def test_slide_info_dataclass(self):
         """Test SlideInfo dataclass initialization."""
         slide_info = SlideInfo(slide_number=1)
@@ -454,6 +620,49 @@ class TestContentExtractor:
         assert slide_info.title is None
         assert slide_info.subtitle is None
         assert slide_info.placeholders == []
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            slide_info.title = "Changed"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            TextElement(content_plain="", content_formatted="").hyperlinks = []
+    
+    def test_resolve_hyperlinks_only_uses_hyperlink_relationships(self):
+        """Test that Transitional and Strict hyperlink types resolve and other types do not."""
+        rels_xml = """<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+            <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+                          Target="../slideLayouts/slideLayout1.xml"/>
+            <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+                          Target="https://example.com" TargetMode="External"/>
+            <Relationship Id="rId3" Type="http://purl.oclc.org/ooxml/officeDocument/relationships/hyperlink"
+                          Target="https://example.org" TargetMode="External"/>
+        </Relationships>"""
+        slide_info = SlideInfo(slide_number=1, text_elements=[{'hyperlinks': ['rId1', 'rId2', 'rId3']}])
+        
+        resolved = self.extractor.resolve_hyperlinks(slide_info, rels_xml)
+        
+        assert resolved.text_elements[0]['hyperlinks'] == ['rId1', 'https://example.com', 'https://example.org']
+        assert slide_info.text_elements[0]['hyperlinks'] == ['rId1', 'rId2', 'rId3']
+    
+    def test_parse_relationships_cached_by_content(self):
+        """Test that identical rels content is parsed once into immutable entries."""
+        from powerpoint_mcp_server.core.content_extractor import _parse_relationships
+        
+        rels_xml = """<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+            <Relationship Id="rId7" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+                          Target="https://example.net"/>
+            <Relationship Id="rId8" Target="../media/image1.png"/>
+        </Relationships>"""
+        _parse_relationships.cache_clear()
+        
+        first = _parse_relationships(rels_xml)
+        second = _parse_relationships(rels_xml)
+        
+        assert second is first
+        assert first == (
+            ('rId7', 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink', 'https://example.net'),
+            ('rId8', '', '../media/image1.png'),
+        )
+        assert _parse_relationships.cache_info().hits == 1
     
     def test_placeholder_info_dataclass(self):
         """Test PlaceholderInfo dataclass initialization."""
@@ -469,6 +678,13 @@ class TestContentExtractor:
         assert placeholder_info.size == (800, 150)
         assert placeholder_info.content == "Test Content"
     
+    def test_placeholder_info_is_immutable(self):
+        """Test that PlaceholderInfo instances cannot be modified after creation."""
+        placeholder_info = PlaceholderInfo(placeholder_type="title", position=(0, 0), size=(0, 0))
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            placeholder_info.content = "Changed"
+    
     def test_extract_text_elements_basic(self):
         """Test extracting basic text elements."""
         slide_xml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -594,6 +810,123 @@ class TestContentExtractor:
         assert text_elem['bolded'] == 1
         assert text_elem['italic'] == 1
     
+    def test_extract_text_elements_dedups_in_first_seen_order(self):
+        """Test that repeated font sizes and colors are kept once, in document order."""
+        runs = ''.join(
+            f'<a:r><a:rPr sz="{sz}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr><a:t>x</a:t></a:r>'
+            for sz, color in [(2400, 'FF0000'), (1200, '00FF00'), (2400, 'FF0000'), (1200, 'FF0000')]
+        )
+        slide_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+        <p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+               xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <p:cSld>
+                <p:spTree>
+                    <p:sp>
+                        <p:txBody>
+                            <a:p>{runs}</a:p>
+                        </p:txBody>
+                    </p:sp>
+                </p:spTree>
+            </p:cSld>
+        </p:sld>"""
+        
+        text_elem = self.extractor.extract_slide_content(slide_xml, 1).text_elements[0]
+        
+        assert text_elem['font_sizes'] == [24.0, 12.0]
+        assert text_elem['font_colors'] == ['#FF0000', '#00FF00']
+    
+    def test_extract_text_elements_caps_distinct_font_sizes(self):
+        """Test that the number of distinct font sizes per element is bounded."""
+        runs = ''.join(f'<a:r><a:rPr sz="{100 * n}"/><a:t>x</a:t></a:r>' for n in range(1, 101))
+        slide_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+        <p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+               xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <p:cSld>
+                <p:spTree>
+                    <p:sp>
+                        <p:txBody>
+                            <a:p>{runs}</a:p>
+                        </p:txBody>
+                    </p:sp>
+                </p:spTree>
+            </p:cSld>
+        </p:sld>"""
+        
+        text_elem = self.extractor.extract_slide_content(slide_xml, 1).text_elements[0]
+        
+        assert len(text_elem['font_sizes']) == 32
+        assert text_elem['font_sizes'][:2] == [1.0, 2.0]
+    
+    def test_extract_text_elements_run_with_split_text(self):
+        """Test that a run's text is joined across all of its a:t nodes."""
+        slide_xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+               xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <p:cSld>
+                <p:spTree>
+                    <p:sp>
+                        <p:txBody>
+                            <a:p>
+                                <a:r><a:t>Split</a:t><a:t>Run</a:t></a:r>
+                            </a:p>
+                        </p:txBody>
+                    </p:sp>
+                </p:spTree>
+            </p:cSld>
+        </p:sld>"""
+        
+        result = self.extractor.extract_slide_content(slide_xml, 1)
+        
+        assert result.text_elements[0]['content_plain'] == "SplitRun"
+    
+    def test_extract_text_elements_default_font_size_by_placeholder(self):
+        """Test that runs without a size get the default for their placeholder type."""
+        def shape(ph_type, text):
+            ph = f'<p:nvSpPr><p:nvPr><p:ph type="{ph_type}"/></p:nvPr></p:nvSpPr>' if ph_type else ''
+            return f'<p:sp>{ph}<p:txBody><a:p><a:r><a:t>{text}</a:t></a:r></a:p></p:txBody></p:sp>'
+        
+        slide_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+        <p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+               xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <p:cSld>
+                <p:spTree>
+                    {shape('ctrTitle', 'Title')}{shape('subTitle', 'Subtitle')}{shape('body', 'Body')}{shape(None, 'Box')}
+                </p:spTree>
+            </p:cSld>
+        </p:sld>"""
+        
+        result = self.extractor.extract_slide_content(slide_xml, 1)
+        
+        assert [elem['font_sizes'] for elem in result.text_elements] == [[44.0], [24.0], [18.0], [18.0]]
+    
+    def test_apply_text_formatting_ignores_nested_elements(self):
+        """Test that formatting flags are only read from direct children of rPr."""
+        r_pr = ET.fromstring("""<a:rPr xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <a:i/>
+            <a:extLst><a:ext><a:u/></a:ext></a:extLst>
+        </a:rPr>""")
+        formatting = _TextFormatting()
+        
+        formatted = self.extractor._apply_text_formatting("Text", r_pr, formatting)
+        
+        assert formatted == "<i>Text</i>"
+        assert formatting.italic == 1
+        assert formatting.underlined == 0
+    
+    def test_apply_text_formatting_attribute_overrides_child(self):
+        """Test that an explicit off attribute wins over a formatting child element."""
+        r_pr = ET.fromstring("""<a:rPr xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" i="0" u="sng">
+            <a:i/>
+            <a:u val="none"/>
+        </a:rPr>""")
+        formatting = _TextFormatting()
+        
+        formatted = self.extractor._apply_text_formatting("Text", r_pr, formatting)
+        
+        assert formatted == "<u>Text</u>"
+        assert formatting.italic == 0
+        assert formatting.underlined == 1
+    
     def test_extract_text_elements_with_strikethrough_highlight(self):
         """Test extracting text with strikethrough and highlight formatting."""
         slide_xml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -804,6 +1137,21 @@ class TestContentExtractor:
         
         assert len(result) == 1
         assert result[0]['content_plain'] == "Test text"    
+    
+    def test_extract_text_elements_skips_table_extraction(self):
+        """Test that extract_text_elements only runs the text extractor."""
+        slide_xml = """<p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+               xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <p:cSld><p:spTree>
+                <p:sp><p:txBody><a:p><a:r><a:t>Only text</a:t></a:r></a:p></p:txBody></p:sp>
+            </p:spTree></p:cSld>
+        </p:sld>"""
+        
+        with patch.object(self.extractor, '_extract_tables') as mock_tables:
+            result = self.extractor.extract_text_elements(slide_xml, 2)
+        
+        mock_tables.assert_not_called()
+        assert [element['content_plain'] for element in result] == ["Only text"]
 
     def test_extract_table_basic(self):
         """Test extracting basic table structure."""
@@ -1032,6 +1380,18 @@ class TestContentExtractor:
         # After whitespace optimization, paragraphs in cells are joined with spaces
         assert table['cells'][0][0]['content'] == "First paragraph Second paragraph"
     
+    def test_extract_cell_text_content_normalizes_whitespace(self):
+        """Test that cell text collapses whitespace across runs and paragraphs."""
+        cell = ET.fromstring("""<a:tc xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <a:txBody>
+                <a:p><a:r><a:t>  Hello   world </a:t></a:r><a:r><a:t> </a:t></a:r></a:p>
+                <a:p/>
+                <a:p><a:r><a:t>Sp</a:t><a:t>lit</a:t></a:r></a:p>
+            </a:txBody>
+        </a:tc>""")
+        
+        assert self.extractor._extract_cell_text_content(cell) == "Hello world Split"
+    
     def test_extract_table_empty_cells(self):
         """Test extracting table with empty cells."""
         slide_xml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -1204,6 +1564,26 @@ class TestContentExtractor:
         assert cell.col_span == 3
         assert cell.formatting['fill_color'] == '#FF0000'
     
+    def test_parse_table_structure_pads_short_rows(self):
+        """Test that short rows are padded with empty cells up to the widest row."""
+        table_elem = ET.fromstring("""<a:tbl xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <a:tr>
+                <a:tc gridSpan="2"><a:txBody><a:p><a:r><a:t>Wide</a:t></a:r></a:p></a:txBody></a:tc>
+                <a:tc rowSpan="2"><a:txBody><a:p><a:r><a:t>Tall</a:t></a:r></a:p></a:txBody></a:tc>
+            </a:tr>
+            <a:tr>
+                <a:tc><a:txBody><a:p><a:r><a:t>Only</a:t></a:r></a:p></a:txBody></a:tc>
+            </a:tr>
+        </a:tbl>""")
+        
+        table = self.extractor._parse_table_structure(table_elem)
+        
+        assert (table.rows, table.columns) == (2, 2)
+        assert (table.cells[0][0].col_span, table.cells[0][1].row_span) == (2, 2)
+        assert table.cells[1][0].content == "Only"
+        assert table.cells[1][1].content == ""
+        assert (table.cells[1][1].row_span, table.cells[1][1].col_span) == (1, 1)
+    
     def test_table_dataclass(self):
         """Test Table dataclass initialization."""
         from powerpoint_mcp_server.core.content_extractor import Table, TableCell
@@ -1433,6 +1813,88 @@ class TestContentExtractor:
         # Should skip the slide image placeholder
         assert len(result.split('\n\n')) == 2
     
+    def test_index_archive(self):
+        """Test that slide and notes parts are indexed by number in one archive scan."""
+        zip_extractor = Mock()
+        zip_extractor.list_archive_contents.return_value = [
+            'ppt/slides/slide2.xml',
+            'ppt/slides/slide10.xml',
+            'ppt/slides/_rels/slide2.xml.rels',
+            'ppt/notesSlides/notesSlide1.xml',
+            'ppt/notesSlides/_rels/notesSlide1.xml.rels',
+            'ppt/slides/notesSlide3.xml',
+            'ppt/slides/slide4.xml.rels',
+            'ppt/slideLayouts/slideLayout1.xml',
+        ]
+        
+        index = self.extractor._index_archive(zip_extractor)
+        
+        assert index == {
+            'slides': {2: 'ppt/slides/slide2.xml', 10: 'ppt/slides/slide10.xml'},
+            'slide_rels': {2: 'ppt/slides/_rels/slide2.xml.rels'},
+            'notes': {1: 'ppt/notesSlides/notesSlide1.xml'},
+            'notes_rels': {1: 'ppt/notesSlides/_rels/notesSlide1.xml.rels'},
+        }
+        zip_extractor.list_archive_contents.assert_called_once_with()
+    
+    def test_build_comment_and_notes_slide_mappings(self):
+        """Test that comment and notes mappings are separate methods reading their own rels files."""
+        rels_files = {
+            'ppt/slides/_rels/slide3.xml.rels': """<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+                <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments"
+                              Target="../comments/comment1.xml"/>
+            </Relationships>""",
+            'ppt/notesSlides/_rels/notesSlide1.xml.rels': """<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+                <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+                              Target="../slides/slide3.xml"/>
+            </Relationships>""",
+        }
+        zip_extractor = Mock()
+        zip_extractor.list_archive_contents.return_value = list(rels_files)
+        zip_extractor.read_xml_content.side_effect = rels_files.get
+        
+        assert self.extractor._build_comment_slide_mapping(zip_extractor) == {'ppt/comments/comment1.xml': 3}
+        assert self.extractor._build_notes_slide_mapping(zip_extractor) == {'ppt/notesSlides/notesSlide1.xml': 3}
+    
+    def test_parse_comment_file_mixed_markup(self):
+        """Test that legacy and threaded comments are parsed in one pass, skipping empty ones."""
+        comment_xml = """<p:cmLst xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+                                 xmlns:p188="http://schemas.microsoft.com/office/powerpoint/2018/main">
+            <p:cm authorId="0" dt="2024-01-01T10:00:00" idx="1">
+                <p:pos x="10" y="20"/>
+                <p:text>Legacy comment</p:text>
+            </p:cm>
+            <p:cm authorId="1" idx="2"/>
+            <p188:threadedComment author="2" created="2024-01-02T10:00:00" id="3">
+                <p188:text>Threaded comment</p188:text>
+            </p188:threadedComment>
+        </p:cmLst>"""
+        
+        comments = self.extractor._parse_comment_file(comment_xml, slide_number=4)
+        
+        assert [c['text'] for c in comments] == ['Legacy comment', 'Threaded comment']
+        assert comments[0]['position'] == {'x': 10, 'y': 20}
+        assert comments[1]['author_id'] == '2'
+        assert comments[1]['datetime'] == '2024-01-02T10:00:00'
+        assert comments[1]['index'] == '3'
+        assert all(c['slide_number'] == 4 for c in comments)
+        assert self.extractor._parse_embedded_comments(comment_xml, 4) == comments
+    
+    def test_parse_comment_file_nested_text_and_position(self):
+        """Test that comment text and position below the comment's children are still found."""
+        comment_xml = """<p:cmLst xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
+            <p:cm authorId="0" idx="1">
+                <p:extLst><p:pos x="5" y="6"/></p:extLst>
+                <p:body><p:text>Nested comment</p:text></p:body>
+            </p:cm>
+        </p:cmLst>"""
+        
+        comments = self.extractor._parse_comment_file(comment_xml, slide_number=2)
+        
+        assert len(comments) == 1
+        assert comments[0]['text'] == 'Nested comment'
+        assert comments[0]['position'] == {'x': 5, 'y': 6}
+    
     def test_extract_section_information(self):
         """Test extracting section information from presentation."""
         presentation_xml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -1455,6 +1917,45 @@ class TestContentExtractor:
         assert result[1]['name'] == "Main Content"
         assert result[2]['name'] == "Conclusion"
     
+    def test_extract_section_information_maps_slide_numbers(self):
+        """Test that PowerPoint 2010 section slide IDs map to presentation order."""
+        presentation_xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <p:presentation xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+                        xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main">
+            <p:sldIdLst>
+                <p:sldId id="256"/>
+                <p:sldId id="257"/>
+                <p:sldId id="258"/>
+            </p:sldIdLst>
+            <p:extLst><p:ext>
+                <p14:sectionLst>
+                    <p14:section name="Intro" id="{A}"><p14:sldIdLst><p14:sldId id="258"/></p14:sldIdLst></p14:section>
+                    <p14:section name="Body" id="{B}"><p14:sldIdLst><p14:sldId id="256"/><p14:sldId id="257"/></p14:sldIdLst></p14:section>
+                </p14:sectionLst>
+            </p:ext></p:extLst>
+        </p:presentation>"""
+        
+        result = self.extractor.extract_section_information(presentation_xml)
+        
+        assert [section['name'] for section in result] == ["Intro", "Body"]
+        assert [ref['slide_number'] for ref in result[0]['slide_ids']] == [3]
+        assert [ref['slide_number'] for ref in result[1]['slide_ids']] == [1, 2]
+        assert result[1]['slide_count'] == 2
+    
+    def test_extract_section_information_matches_any_namespace(self):
+        """Test that sections are found by local name regardless of namespace."""
+        presentation_xml = """<p:presentation xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+                        xmlns:x="urn:example:sections">
+            <x:sectionLst>
+                <x:section name="Only"><x:sldIdLst><x:sldId id="256"/></x:sldIdLst></x:section>
+            </x:sectionLst>
+        </p:presentation>"""
+        
+        result = self.extractor.extract_section_information(presentation_xml)
+        
+        assert [(section['name'], section['slide_count']) for section in result] == [("Only", 1)]
+        assert self.extractor.extract_section_information("<p:presentation xmlns:p='urn:p'/>") == []
+    
     def test_get_slide_size_info(self):
         """Test extracting slide size information with unit conversions."""
         presentation_xml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -1474,6 +1975,13 @@ class TestContentExtractor:
         assert result['height_points'] == 540.0 # 7.5 * 72
         assert result['aspect_ratio'] == 1.33  # 10.0 / 7.5
     
+    def test_get_slide_size_info_without_size(self):
+        """Test that a missing or incomplete p:sldSz yields no size information."""
+        template = """<p:presentation xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">{}</p:presentation>"""
+        
+        assert self.extractor.get_slide_size_info(template.format("")) == {}
+        assert self.extractor.get_slide_size_info(template.format('<p:sldSz cx="9144000"/>')) == {}
+    
     def test_extract_slide_metadata_no_notes(self):
         """Test extracting slide metadata without notes."""
         slide_xml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -1650,6 +2158,106 @@ class TestContentExtractorCaching:
         assert stats['caching_enabled'] is True
         assert stats['content_cache']['total_entries'] >= 2
     
+    def test_slide_content_caching_with_content_digest(self):
+        """Test that a supplied content digest is used as the cache key."""
+        slide_xml = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+        <p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
+            <p:cSld><p:spTree></p:spTree></p:cSld>
+        </p:sld>'''
+        
+        result1 = self.extractor.extract_slide_content(slide_xml, 1, content_digest='abc123')
+        result2 = self.extractor.extract_slide_content(slide_xml, 1, content_digest='abc123')
+        
+        assert result2 is result1
+        assert self.extractor.cache_manager.get('slide_content_1_abc123') is result1
+    
+    def test_hyperlink_relationships_cached_by_digest(self):
+        """Test that a slide's rels file is read once per content fingerprint."""
+        rels_xml = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+        <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+            <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+                          Target="https://example.com" TargetMode="External"/>
+        </Relationships>'''
+        zip_extractor = Mock()
+        zip_extractor.get_content_digest.return_value = 'r1'
+        zip_extractor.read_xml_content.return_value = rels_xml
+        
+        first = self.extractor._resolve_hyperlink_relationships(zip_extractor, 1, [{'hyperlinks': ['rId2', 'rId9']}])
+        second = self.extractor._resolve_hyperlink_relationships(zip_extractor, 1, [{'hyperlinks': ['rId2']}])
+        
+        assert first[0]['hyperlinks'] == ['https://example.com', 'rId9']
+        assert second[0]['hyperlinks'] == ['https://example.com']
+        zip_extractor.read_xml_content.assert_called_once_with('ppt/slides/_rels/slide1.xml.rels')
+    
+    def test_hyperlink_resolution_leaves_cached_slide_unchanged(self):
+        """Test that resolving hyperlinks returns copies instead of editing the cached slide."""
+        slide_xml = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+        <p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+               xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
+               xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+            <p:cSld><p:spTree><p:sp><p:txBody><a:p>
+                <a:r><a:t>Link</a:t></a:r><a:hlinkClick r:id="rId2"/>
+            </a:p></p:txBody></p:sp></p:spTree></p:cSld>
+        </p:sld>'''
+        rels_xml = '''<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+            <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+                          Target="https://example.com" TargetMode="External"/>
+        </Relationships>'''
+        zip_extractor = Mock()
+        zip_extractor.get_content_digest.return_value = None
+        zip_extractor.read_xml_content.return_value = rels_xml
+        
+        slide_info = self.extractor.extract_slide_content(slide_xml, 1, content_digest='cached')
+        resolved = self.extractor._resolve_hyperlink_relationships(zip_extractor, 1, slide_info.text_elements)
+        resolved_slide = self.extractor.resolve_hyperlinks(slide_info, rels_xml)
+        
+        assert resolved[0]['hyperlinks'] == ['https://example.com']
+        assert resolved_slide.text_elements[0]['hyperlinks'] == ['https://example.com']
+        cached = self.extractor.extract_slide_content(slide_xml, 1, content_digest='cached')
+        assert cached is slide_info
+        assert cached.text_elements[0]['hyperlinks'] == ['rId2']
+    
+    def _batch_slide_xml(self, title):
+        """Build a minimal slide with a title placeholder."""
+        return f'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+        <p:sld xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+               xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+            <p:cSld>
+                <p:spTree>
+                    <p:sp>
+                        <p:nvSpPr><p:nvPr><p:ph type="title"/></p:nvPr></p:nvSpPr>
+                        <p:txBody><a:p><a:r><a:t>{title}</a:t></a:r></a:p></p:txBody>
+                    </p:sp>
+                </p:spTree>
+            </p:cSld>
+        </p:sld>'''
+    
+    def test_extract_slides_batch_uses_cache(self):
+        """Test that batch extraction keeps order, reuses and fills the cache."""
+        cached = self.extractor.extract_slide_content(self._batch_slide_xml("One"), 1, content_digest='d1')
+        
+        results = self.extractor.extract_slides_batch([
+            (self._batch_slide_xml("One"), 1, 'd1'),
+            (self._batch_slide_xml("Two"), 2, 'd2'),
+            ("<not xml", 3, 'd3')
+        ])
+        
+        assert results[0] is cached
+        assert results[1].title == "Two"
+        assert results[2].slide_number == 3 and results[2].title is None
+        assert self.extractor.cache_manager.get('slide_content_2_d2') is results[1]
+        assert self.extractor.cache_manager.get('slide_content_3_d3') is None
+    
+    def test_extract_slides_batch_process_pool(self):
+        """Test that batch extraction across worker processes matches in-process results."""
+        slides = [(self._batch_slide_xml(f"Slide {n}"), n, None) for n in range(1, 11)]
+        
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as executor:
+            results = self.extractor.extract_slides_batch(slides, executor=executor)
+        
+        assert [result.title for result in results] == [f"Slide {n}" for n in range(1, 11)]
+        assert [result.slide_number for result in results] == list(range(1, 11))
+    
     def test_cache_stats(self):
         """Test cache statistics functionality."""
         # Initially empty cache
@@ -463,6 +463,27 @@ class TestTextFormattingAnalyzer:
         formatting_analyzer.clear_cache()
         assert len(formatting_analyzer._analysis_cache) == 0
     
+    def test_extract_title_formatting_uses_placeholder_lookup(self, formatting_analyzer):
+        """Test that title shapes are selected via the shape's placeholder element."""
+        title_shape = Mock()
+        body_shape = Mock()
+        title_ph = Mock()
+        title_ph.get.return_value = 'title'
+        
+        content_extractor = formatting_analyzer.content_extractor
+        content_extractor.xml_parser.find_elements_with_namespace.return_value = [title_shape, body_shape]
+        content_extractor._find_placeholder_element.side_effect = (
+            lambda shape: title_ph if shape is title_shape else None
+        )
+        
+        with patch.object(formatting_analyzer, '_analyze_shape_text_formatting') as analyze:
+            analyze.return_value = Mock()
+            elements = formatting_analyzer._extract_title_formatting(Mock(), 1)
+        
+        assert len(elements) == 1
+        analyze.assert_called_once_with(title_shape, 1, ContentType.TITLES, 0)
+        content_extractor.xml_parser.find_element_with_namespace.assert_not_called()
+    
     def test_analyze_formatting_integration(self, formatting_analyzer):
         """Test the main analyze_formatting method integration with real file."""
         # Test analysis with actual test file
@@ -213,6 +213,44 @@ class TestXMLParser:
         
         assert element is None
     
+    def test_find_element_with_mixed_prefix_and_clark_notation(self):
+        """Test that Clark-notation names are not treated as prefixes."""
+        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+        <root xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"
+              xmlns:v="urn:schemas-microsoft-com:vml">
+            <p:test><v:shape>content</v:shape></p:test>
+        </root>"""
+        
+        root = self.parser.parse_xml_string(xml_content)
+        element = self.parser.find_element_with_namespace(
+            root, './/p:test/{urn:schemas-microsoft-com:vml}shape'
+        )
+        
+        assert element is not None
+        assert element.text == 'content'
+    
+    def test_find_elements_with_unknown_prefix_returns_empty(self):
+        """Test that an unknown namespace prefix yields no matches."""
+        root = self.parser.parse_xml_string("<root><test/></root>")
+        
+        assert self.parser.find_elements_with_namespace(root, './/zz:test') == []
+        assert self.parser.find_element_with_namespace(root, './/zz:test') is None
+    
+    def test_find_descendants_by_tag_excludes_search_root(self):
+        """Test that './/tag' lookups match findall semantics for nested same-tag elements."""
+        xml_content = """<p:grpSp xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">
+            <p:grpSp><p:sp/></p:grpSp>
+            <p:sp/>
+        </p:grpSp>"""
+        
+        root = self.parser.parse_xml_string(xml_content)
+        groups = self.parser.find_elements_with_namespace(root, './/p:grpSp')
+        
+        assert groups == root.findall('.//{http://schemas.openxmlformats.org/presentationml/2006/main}grpSp')
+        assert len(groups) == 1 and groups[0] is not root
+        assert self.parser.find_element_with_namespace(root, './/p:grpSp') is groups[0]
+        assert len(self.parser.find_elements_with_namespace(root, './/p:sp')) == 2
+
     def test_get_element_text_with_content(self):
         """Test getting text from element with content."""
         xml_content = """<?xml version="1.0" encoding="UTF-8"?>
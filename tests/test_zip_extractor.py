@@ -154,6 +154,33 @@ class TestZipExtractor:
         finally:
             os.unlink(tmp_path)
     
+    def test_get_content_digest(self):
+        """Test content fingerprints taken from the ZIP central directory."""
+        tmp_path = self.create_test_pptx()
+        other_path = self.create_test_pptx()
+        try:
+            with ZipExtractor(tmp_path) as extractor:
+                digest1 = extractor.get_content_digest('ppt/slides/slide1.xml')
+                digest2 = extractor.get_content_digest('ppt/slides/slide2.xml')
+                layout_digest = extractor.get_content_digest('ppt/slideLayouts/slideLayout1.xml')
+                
+                # Identical members of another archive do not share fingerprints
+                with ZipExtractor(other_path) as other_extractor:
+                    assert other_extractor.get_content_digest('ppt/slides/slide1.xml') != digest1
+                
+                assert digest1 is not None
+                # Identical content gives identical fingerprints
+                assert digest1 == digest2
+                assert digest1 != layout_digest
+                assert extractor.get_content_digest('nonexistent.xml') is None
+            
+            # Reopening the unchanged archive gives the same fingerprints
+            with ZipExtractor(tmp_path) as extractor:
+                assert extractor.get_content_digest('ppt/slides/slide1.xml') == digest1
+        finally:
+            os.unlink(tmp_path)
+            os.unlink(other_path)
+    
     def test_list_archive_contents(self):
         """Test listing archive contents."""
         tmp_path = self.create_test_pptx()